@@ -2,12 +2,40 @@
 Helper script to compile `src/grammar.pynini` into `src/grammar.far` using Pynini.
 """
 from __future__ import annotations
+import importlib.machinery
+import importlib.util
+import json
 import os
 
+
+def load_cached_mapping(cache_path: str, src: str) -> dict[str, str] | None:
+    """Return the mapping saved by a previous run, or ``None`` when there is
+    no cache or it is older than the grammar source.
+    """
+    try:
+        if os.path.getmtime(src) >= os.path.getmtime(cache_path):
+            return None
+        with open(cache_path, "r", encoding="utf8") as fh:
+            mapping = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return mapping if isinstance(mapping, dict) else None
+
+
+def save_cached_mapping(cache_path: str, mapping: dict[str, str]) -> None:
+    """Write `mapping` next to the FAR so the next run can skip enumeration."""
+    try:
+        with open(cache_path, "w", encoding="utf8") as fh:
+            json.dump(mapping, fh, ensure_ascii=False, indent=0)
+    except OSError as e:
+        print("Could not write mapping cache:", e)
+
+
 def main() -> int:
     project_root = os.path.dirname(os.path.dirname(__file__))
     src = os.path.join(project_root, "src", "grammar.pynini")
     far_out = os.path.join(project_root, "src", "grammar.far")
+    mapping_cache = os.path.join(project_root, "src", "grammar.mapping.json")
 
     if not os.path.exists(src):
         print(f"Grammar source not found: {src}")
@@ -21,48 +49,55 @@ def main() -> int:
         print(e)
         return 3
 
-    # Load grammar file and execute it in a minimal namespace
-    namespace = {}
-    with open(src, "r", encoding="utf8") as fh:
-        code = fh.read()
-    exec(code, namespace)  # define build_fst in namespace
+    # Import the grammar file as a module; `.pynini` is not a recognised
+    # source suffix, so the loader has to be given explicitly.
+    loader = importlib.machinery.SourceFileLoader("grammar", src)
+    spec = importlib.util.spec_from_file_location("grammar", src, loader=loader)
+    grammar = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(grammar)
 
-    if "build_fst" not in namespace:
+    build_fst = getattr(grammar, "build_fst", None)
+    if build_fst is None:
         print("grammar.pynini must define build_fst()")
         return 4
 
-    build_fst = namespace["build_fst"]
     result = build_fst()
 
     # mapping 0..1000 to words by enumerating values
     if isinstance(result, dict):
         two_digit_fst = result.get("two_digit")
         _ = result.get("thousand")
-        # If two_digit_fst is available, enumerate 0..99
-        mapping = {}
-        try:
-            for i in range(0, 100):
-                s = str(i)
-                try:
-                    w = pynini.shortestpath(two_digit_fst @ pynini.acceptor(s)).stringify()
-                except Exception:
-                    continue
-                mapping[s] = w
-            mapping["1000"] = "one thousand"
-        except Exception:
-            pass
-
-        # Build an FST by unioning all cross() of mapping
-        union_fst = None
-        for k, v in mapping.items():
-            x = pynini.cross(k, v)
-            union_fst = x if union_fst is None else union_fst | x
-
-        if union_fst is None:
+        # Reuse the mapping from a previous run unless the grammar changed
+        mapping = load_cached_mapping(mapping_cache, src)
+        if mapping is None:
+            # If two_digit_fst is available, enumerate 0..99
+            # Compose it once against all inputs and read every (input, output)
+            # pair in a single traversal, keeping the lowest-weight output per
+            # input as shortestpath did. Restricting the inputs first keeps the
+            # lattice finite unless the grammar loops on epsilon input.
+            mapping = {}
+            best_weights = {}
+            try:
+                inputs = pynini.union(*(str(i) for i in range(0, 100)))
+                lattice = inputs @ two_digit_fst
+                for istring, ostring, weight in lattice.paths().items():
+                    weight = float(weight)
+                    if istring not in best_weights or weight < best_weights[istring]:
+                        best_weights[istring] = weight
+                        mapping[istring] = ostring
+                mapping["1000"] = "one thousand"
+            except Exception as e:
+                print("Could not enumerate the two_digit FST:", e)
+            else:
+                # Only a complete enumeration is worth reusing on later runs
+                save_cached_mapping(mapping_cache, mapping)
+
+        if not mapping:
             print("Failed to construct mapping; cannot write FAR.")
             return 6
 
-        final_fst = union_fst.optimize()
+        # Build the FST from the mapping pairs in one native string_map call
+        final_fst = pynini.string_map(mapping.items()).optimize()
     else:
         final_fst = result
 
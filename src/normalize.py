@@ -3,47 +3,71 @@
 from __future__ import annotations
 
 import re
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 import sys
 import os
 
+try:
+    import pynini
+    _HAS_PYNINI = True
+except ImportError:  # pragma: no cover - environment dependent
+    _HAS_PYNINI = False
 
-def number_to_words(n: int) -> str:
-    """Return English words for 0 <= n <= 1000.
-    Hyphenates values like 21 -> "twenty-one" and uses "one thousand"
-    for 1000.
+# Integer tokens on a word boundary. Negative numbers (a minus sign, possibly
+# followed by whitespace) match the first branch and leave group 1 unset.
+_NUM_RE = re.compile(r"-\s*\d+\b|\b(\d+)\b")
+
+_ASCII_DIGITS = b"0123456789"
+
+
+def _may_contain_number(text: str) -> bool:
+    """Cheap pre-check before scanning `text` with `_NUM_RE`.
+    ASCII text is tested for digits at the byte level; anything else is
+    searched with the pattern itself.
     """
-    if not (0 <= n <= 1000):
-        raise ValueError("number out of range (0-1000)")
+    if text.isascii():
+        data = text.encode("ascii")
+        return len(data.translate(None, _ASCII_DIGITS)) != len(data)
+    return _NUM_RE.search(text) is not None
+
 
+def _build_words_table() -> tuple[str, ...]:
+    """Return English words for every value in 0..1000, indexed by value.
+    Built once at import so `number_to_words` is a single tuple lookup.
+    """
     units = [ "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine" ]
 
     teens = ["ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
 
     tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
 
-    if n == 1000:
-        return "one thousand"
+    # 0..19, then 20..99 row by row: "twenty", "twenty-one", ...
+    words = units + teens
+    for t in range(2, 10):
+        words.append(tens[t])
+        words.extend(f"{tens[t]}-{u}" for u in units[1:])
+
+    # 100..999: each hundreds prefix is built once and joined to 1..99
+    for h in range(1, 10):
+        hundred = f"{units[h]} hundred"
+        words.append(hundred)
+        words.extend(f"{hundred} {w}" for w in words[1:100])
+
+    words.append("one thousand")
+    return tuple(words)
 
-    if n < 10:
-        return units[n]
 
-    if 10 <= n < 20:
-        return teens[n - 10]
+_WORDS: tuple[str, ...] = _build_words_table()
 
-    if n < 100:
-        t, u = divmod(n, 10)
-        if u == 0:
-            return tens[t]
-        else:
-            return f"{tens[t]}-{units[u]}"
 
-    # 100..999
-    h, rest = divmod(n, 100)
-    if rest == 0:
-        return f"{units[h]} hundred"
-    else:
-        return f"{units[h]} hundred {number_to_words(rest)}"
+def number_to_words(n: int) -> str:
+    """Return English words for 0 <= n <= 1000.
+    Hyphenates values like 21 -> "twenty-one" and uses "one thousand"
+    for 1000.
+    """
+    if not (0 <= n <= 1000):
+        raise ValueError("number out of range (0-1000)")
+    return _WORDS[n]
 
 
 def replace_numbers_in_text(text: str, convert_fn: Callable[[int], str]) -> str:
@@ -51,31 +75,98 @@ def replace_numbers_in_text(text: str, convert_fn: Callable[[int], str]) -> str:
     Preserves tokens that are negative, have leading zeros, or lie outside
     the 0–1000 range.
     """
-
-    def repl(match: re.Match) -> str:
-        s = match.group(0)
-        start_pos = match.start()
-
-        # If a minus sign precedes the token (possibly with whitespace), skip it.
-        if start_pos > 0:
-            i = start_pos - 1
-            while i >= 0 and text[i].isspace():
-                i -= 1
-            if i >= 0 and text[i] == "-":
-                return s
-
+    # Splice converted tokens between the untouched spans of `text`.
+    parts: list[str] = []
+    pos = 0
+    for match in _NUM_RE.finditer(text):
+        s = match.group(1)
+        if s is None:  # negative number
+            continue
+        if len(s) > 1 and s[0] == "0":
+            continue
         try:
-            if len(s) > 1 and s.startswith("0"):
-                return s
             n = int(s)
         except ValueError:
-            return s
+            continue
 
         if 0 <= n <= 1000:
-            return convert_fn(n)
-        return s
+            parts.append(text[pos:match.start()])
+            parts.append(convert_fn(n))
+            pos = match.end()
+
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+_FAR_PATH = os.path.join(os.path.dirname(__file__), "grammar.far")
+_FAR_PATH_EXISTS = os.path.exists(_FAR_PATH)
 
-    return re.sub(r"\b\d+\b", repl, text)
+_UNSET = object()
+
+# Loaded `normalize` FST, or ``None`` when Pynini/FAR is not available.
+_FST_CACHE: object = _UNSET
+
+# Digit string -> FST output for every token the FST has accepted so far.
+_FST_TOKEN_CACHE: dict[str, str] = {}
+
+
+def _load_fst():
+    """Load the `normalize` FST from `src/grammar.far`.
+    Returns ``None`` on any failure.
+    """
+    if not _HAS_PYNINI or not _FAR_PATH_EXISTS:
+        return None
+
+    try:
+        far = pynini.Far(_FAR_PATH, mode="r")
+        # Fall back to the first archive entry when there is no `normalize` key.
+        if not far.find("normalize"):
+            far.reset()
+        if far.done():
+            return None
+        return far.get_fst()
+    except Exception:
+        return None
+
+
+def _get_fst():
+    """Return the cached `_load_fst` result, loading the FAR on first use."""
+    global _FST_CACHE
+    if _FST_CACHE is _UNSET:
+        _FST_CACHE = _load_fst()
+    return _FST_CACHE
+
+
+def _convertible_tokens(text: str) -> Iterator[str]:
+    """Yield the canonical `str(int)` form of every token in `text` that
+    `replace_numbers_in_text` hands to its callback (0..1000, no leading zero).
+    """
+    for tok in _NUM_RE.findall(text):
+        if not tok or len(tok) > 4 or (len(tok) > 1 and tok[0] == "0"):
+            continue
+        n = int(tok)
+        if n <= 1000:
+            yield str(n)
+
+
+def _rewrite_tokens(tokens: Iterable[str]) -> dict[str, str]:
+    """Rewrite digit strings with the cached FST and return the token cache.
+    Unseen tokens are composed against the FST in one pass, as a single
+    union acceptor; tokens the FST rejects are left out of the cache. When an
+    input has several rewrites, the lowest-weight one is kept.
+    """
+    missing = set(tokens).difference(_FST_TOKEN_CACHE)
+    if missing:
+        lattice = pynini.union(*missing) @ _get_fst()
+        best_weights: dict[str, float] = {}
+        for istring, ostring, weight in lattice.paths().items():
+            weight = float(weight)
+            if istring not in best_weights or weight < best_weights[istring]:
+                best_weights[istring] = weight
+                _FST_TOKEN_CACHE[istring] = ostring
+    return _FST_TOKEN_CACHE
 
 
 def load_fst_and_normalize(sentence: str) -> str | None:
@@ -83,34 +174,13 @@ def load_fst_and_normalize(sentence: str) -> str | None:
     Returns the normalized sentence or ``None`` when Pynini/FAR is not
     available.
     """
-    try:
-        import pynini
-        from pynini import Far
-    except Exception:  # pragma: no cover - environment dependent
-        return None
-
-    far_path = os.path.join(os.path.dirname(__file__), "grammar.far")
-    if not os.path.exists(far_path):
+    if _get_fst() is None:
         return None
 
     try:
-        far = pynini.Far(far_path, mode="r")
-        fst = far.get("normalize") if "normalize" in far else None
-        if fst is None:
-            keys = list(far.keys())
-            if not keys:
-                return None
-            fst = far[keys[0]]
-
-        from pynini.lib import rewrite
-
-        def apply_fst_to_token(tok: str) -> str:
-            try:
-                return rewrite.one_top_rewrite(tok, fst)
-            except Exception:
-                return tok
-        # python fallback
-        return replace_numbers_in_text(sentence, lambda n: apply_fst_to_token(str(n)))
+        # Keys are canonical `str(int)` forms, which is what the callback sees.
+        table = _rewrite_tokens(_convertible_tokens(sentence))
+        return replace_numbers_in_text(sentence, lambda n: table.get(str(n), str(n)))
     except Exception:
         return None
 
@@ -119,6 +189,10 @@ def normalize_text(sentence: str) -> str:
     """
     Normalize cardinal numbers in `sentence`.It Uses the FAR-based FST when available, otherwise the Python fallback.
     """
+    # Nothing to convert: skip loading the FAR and the fallback entirely.
+    if not _may_contain_number(sentence):
+        return sentence
+
     fst_result = load_fst_and_normalize(sentence)
     if fst_result is not None:
         return fst_result
@@ -126,6 +200,27 @@ def normalize_text(sentence: str) -> str:
     return replace_numbers_in_text(sentence, lambda n: number_to_words(n))
 
 
+def normalize_texts(sentences: Iterable[str]) -> list[str]:
+    """
+    Normalize cardinal numbers in each of `sentences`. With the FAR available, the numeric tokens of the whole batch are rewritten in a single FST composition.
+    """
+    sentences = list(sentences)
+
+    if _get_fst() is not None:
+        try:
+            table = _rewrite_tokens(
+                tok for sentence in sentences for tok in _convertible_tokens(sentence)
+            )
+            return [
+                replace_numbers_in_text(sentence, lambda n: table.get(str(n), str(n)))
+                for sentence in sentences
+            ]
+        except Exception:
+            pass
+
+    return [replace_numbers_in_text(sentence, number_to_words) for sentence in sentences]
+
+
 def _cli_main(argv: list[str] | None = None) -> int:
     argv = list(sys.argv) if argv is None else list(argv)
     if len(argv) < 2:
@@ -5,7 +5,8 @@ import os
 # Add project root to Python path for direct execution
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.normalize import normalize_text
+from src.normalize import normalize_text, normalize_texts, number_to_words
+from src import normalize as normalize_module
 
 
 @pytest.mark.parametrize(
@@ -65,6 +66,7 @@ from src.normalize import normalize_text
         ("No numbers here.", "No numbers here."),
         ("The number 1001 is too large.", "The number 1001 is too large."),  # Outside range
         ("I have -5 apples.", "I have -5 apples."),  # Negative (outside range)
+        ("I have - 5 apples.", "I have - 5 apples."),  # Negative with whitespace after the sign
         ("The code is 0123.", "The code is 0123."),  # Leading zero (preserved)
         
         # Boundary cases
@@ -95,3 +97,66 @@ def test_edge_cases():
     assert normalize_text("0 abc") == "zero abc"  # Word boundary with space
     assert normalize_text("abc 0") == "abc zero"  # Word boundary with space
 
+    # Non-ASCII text
+    assert normalize_text("café") == "café"
+    assert normalize_text("café 21") == "café twenty-one"
+
+
+def test_number_to_words_range():
+    """Test direct conversion at the boundaries and outside the supported range."""
+    assert number_to_words(0) == "zero"
+    assert number_to_words(115) == "one hundred fifteen"
+    assert number_to_words(1000) == "one thousand"
+    with pytest.raises(ValueError):
+        number_to_words(-1)
+    with pytest.raises(ValueError):
+        number_to_words(1001)
+
+
+def test_normalize_texts_batch():
+    """Test that batch normalization matches sentence-by-sentence results."""
+    sentences = ["I have 3 dogs and 21 cats.", "No numbers here.", "", "I have -5 apples and 1000 pears.", "3 again"]
+    assert normalize_texts(sentences) == [normalize_text(s) for s in sentences]
+    assert normalize_texts([]) == []
+
+
+@pytest.mark.skipif(
+    not (normalize_module._HAS_PYNINI and normalize_module._FAR_PATH_EXISTS),
+    reason="Pynini or src/grammar.far not available",
+)
+def test_fst_path_is_used():
+    """Test that the compiled FAR is loaded and actually applied."""
+    assert normalize_module._get_fst() is not None
+
+    normalize_module._FST_TOKEN_CACHE.clear()
+    assert normalize_text("21") == "twenty-one"
+    assert normalize_module._FST_TOKEN_CACHE.get("21") == "twenty-one"
+
+
+@pytest.mark.skipif(
+    not (normalize_module._HAS_PYNINI and normalize_module._FAR_PATH_EXISTS),
+    reason="Pynini or src/grammar.far not available",
+)
+def test_fst_batch_fills_token_cache():
+    """Test that the batch API rewrites its tokens through the FST token cache."""
+    normalize_module._FST_TOKEN_CACHE.clear()
+    assert normalize_texts(["21 cats", "No numbers.", "1000 and 2024", "-5 and 0123"]) == [
+        "twenty-one cats", "No numbers.", "one thousand and 2024", "-5 and 0123"
+    ]
+    assert normalize_module._FST_TOKEN_CACHE == {"21": "twenty-one", "1000": "one thousand"}
+
+
+@pytest.mark.skipif(not normalize_module._HAS_PYNINI, reason="Pynini not available")
+@pytest.mark.parametrize("cheap_first", [True, False])
+def test_fst_prefers_lowest_weight_rewrite(monkeypatch, cheap_first):
+    """Test that an ambiguous weighted FST is applied with its lowest-weight output."""
+    import pynini
+
+    cheap = pynini.cross("5", "five")
+    costly = pynini.cross("5", "FIVE") + pynini.accep("", weight=3.0)
+    arms = [cheap, costly] if cheap_first else [costly, cheap]
+    fst = pynini.union(*arms, pynini.cross("7", "seven"))
+
+    monkeypatch.setattr(normalize_module, "_FST_CACHE", fst)
+    monkeypatch.setattr(normalize_module, "_FST_TOKEN_CACHE", {})
+    assert normalize_module.load_fst_and_normalize("5 and 7") == "five and seven"